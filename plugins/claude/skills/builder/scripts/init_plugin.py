@@ -14,66 +14,15 @@ Example:
 import argparse
 import json
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Lowercase alphanumeric words joined by single hyphens
+_KEBAB_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
 
-def create_directory_structure(
-    plugin_name: str,
-    description: str,
-    author: str,
-    output_dir: Optional[str] = None
-) -> Path:
-    """
-    Create plugin directory structure with all necessary files.
-
-    Args:
-        plugin_name: Name of the plugin (kebab-case)
-        description: Plugin description
-        author: Plugin author name
-        output_dir: Optional output directory (defaults to current directory)
-
-    Returns:
-        Path to created plugin directory
-    """
-    # Determine base directory
-    base_dir = Path(output_dir) if output_dir else Path.cwd()
-    plugin_dir = base_dir / plugin_name
-
-    # Check if directory already exists
-    if plugin_dir.exists():
-        print(f"Error: Directory '{plugin_dir}' already exists", file=sys.stderr)
-        sys.exit(1)
-
-    # Create directory structure
-    plugin_dir.mkdir(parents=True)
-    (plugin_dir / ".claude-plugin").mkdir()
-    (plugin_dir / "agents").mkdir()
-    (plugin_dir / "commands").mkdir()
-    (plugin_dir / "skills").mkdir()
-
-    print(f"Created plugin directory: {plugin_dir}")
-
-    # Create plugin.json
-    plugin_json = {
-        "name": plugin_name,
-        "version": "0.1.0",
-        "description": description,
-        "author": author,
-        "agents": [],
-        "commands": [],
-        "skills": []
-    }
-
-    plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
-    with open(plugin_json_path, "w") as f:
-        json.dump(plugin_json, f, indent=2)
-
-    print(f"Created: {plugin_json_path}")
-
-    # Create README.md
-    readme_content = f"""# {plugin_name}
+_README_TMPL = """# {plugin_name}
 
 {description}
 
@@ -106,14 +55,7 @@ Add this plugin to Claude Code:
 0.1.0
 """
 
-    readme_path = plugin_dir / "README.md"
-    with open(readme_path, "w") as f:
-        f.write(readme_content)
-
-    print(f"Created: {readme_path}")
-
-    # Create SKILLS.md
-    skills_content = f"""# {plugin_name} Skills
+_SKILLS_TMPL = """# {plugin_name} Skills
 
 This document describes the skills provided by the {plugin_name} plugin.
 
@@ -136,44 +78,85 @@ This document describes the skills provided by the {plugin_name} plugin.
 [List any reference materials or documentation included with the skills]
 """
 
-    skills_path = plugin_dir / "SKILLS.md"
-    with open(skills_path, "w") as f:
-        f.write(skills_content)
+# Documentation files rendered into the plugin root
+_DOC_FILES = (("README.md", _README_TMPL), ("SKILLS.md", _SKILLS_TMPL))
 
-    print(f"Created: {skills_path}")
 
-    # Create placeholder files
-    agent_placeholder = plugin_dir / "agents" / ".gitkeep"
-    agent_placeholder.touch()
+def create_directory_structure(
+    plugin_name: str,
+    description: str,
+    author: str,
+    output_dir: Optional[str] = None
+) -> Path:
+    """
+    Create plugin directory structure with all necessary files.
 
-    command_placeholder = plugin_dir / "commands" / ".gitkeep"
-    command_placeholder.touch()
+    Args:
+        plugin_name: Name of the plugin (kebab-case)
+        description: Plugin description
+        author: Plugin author name
+        output_dir: Optional output directory (defaults to current directory)
 
-    skill_placeholder = plugin_dir / "skills" / ".gitkeep"
-    skill_placeholder.touch()
+    Returns:
+        Path to created plugin directory
+    """
+    # Determine base directory
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    plugin_dir = base_dir / plugin_name
+
+    # Check if directory already exists
+    if plugin_dir.exists():
+        print(f"Error: Directory '{plugin_dir}' already exists", file=sys.stderr)
+        sys.exit(1)
+
+    # Create directory structure; makedirs creates plugin_dir along the way
+    base = str(plugin_dir)
+    os.makedirs(os.path.join(base, ".claude-plugin"))
+    for component_dir in ("agents", "commands", "skills"):
+        component_path = os.path.join(base, component_dir)
+        os.makedirs(component_path)
+        # Placeholder so the empty directory is tracked by git
+        os.close(os.open(os.path.join(component_path, ".gitkeep"), os.O_CREAT | os.O_WRONLY, 0o644))
+
+    log = [f"Created plugin directory: {plugin_dir}"]
 
-    print(f"\nPlugin scaffold created successfully!")
-    print(f"\nNext steps:")
-    print(f"1. Edit {plugin_json_path} to add component references")
-    print(f"2. Create agents in {plugin_dir / 'agents'}/")
-    print(f"3. Create commands in {plugin_dir / 'commands'}/")
-    print(f"4. Create skills in {plugin_dir / 'skills'}/")
-    print(f"5. Update README.md and SKILLS.md with actual documentation")
+    # Render plugin.json and the documentation templates
+    plugin_json = {
+        "name": plugin_name,
+        "version": "0.1.0",
+        "description": description,
+        "author": author,
+        "agents": [],
+        "commands": [],
+        "skills": []
+    }
+    fields = {"plugin_name": plugin_name, "description": description, "author": author}
+
+    plugin_json_path = os.path.join(base, ".claude-plugin", "plugin.json")
+    files = [(plugin_json_path, json.dumps(plugin_json, indent=2))]
+    files.extend((os.path.join(base, name), template.format_map(fields)) for name, template in _DOC_FILES)
+
+    # Write all scaffold files in a single pass
+    for path, content in files:
+        with open(path, "wb") as f:
+            f.write(content.encode("utf-8"))
+        log.append(f"Created: {path}")
+
+    log.append("\nPlugin scaffold created successfully!")
+    log.append("\nNext steps:")
+    log.append(f"1. Edit {plugin_json_path} to add component references")
+    log.append(f"2. Create agents in {os.path.join(base, 'agents')}/")
+    log.append(f"3. Create commands in {os.path.join(base, 'commands')}/")
+    log.append(f"4. Create skills in {os.path.join(base, 'skills')}/")
+    log.append("5. Update README.md and SKILLS.md with actual documentation")
+    sys.stdout.write("\n".join(log) + "\n")
 
     return plugin_dir
 
 
 def validate_plugin_name(name: str) -> bool:
     """Validate plugin name follows kebab-case convention."""
-    if not name:
-        return False
-    if not all(c.islower() or c.isdigit() or c == '-' for c in name):
-        return False
-    if name.startswith('-') or name.endswith('-'):
-        return False
-    if '--' in name:
-        return False
-    return True
+    return bool(_KEBAB_RE.fullmatch(name))
 
 
 def main():
@@ -12,12 +12,45 @@ Example:
 """
 
 import argparse
+import errno
 import json
+import os
+import re
+import stat
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 
+def _reject_constant(name: str) -> Any:
+    """Reject NaN and Infinity, which are not valid JSON."""
+    raise ValueError(f"{name} is not valid JSON")
+
+
+# orjson parses large marketplace files considerably faster; fall back to
+# the stdlib parser when it is not installed. Both reject NaN and Infinity.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data, parse_constant=_reject_constant)
+
+# Lowercase alphanumeric words joined by single hyphens
+_KEBAB_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+_ICONS = {"error": "❌", "warning": "⚠️"}
+
+_COMPONENT_TYPES = ("agents", "commands", "skills")
+
+# stat() errors that mean "no such path", as treated by Path.exists()
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+
+def _strip_dot_slash(path: str) -> str:
+    """Remove a single leading './' from a relative path."""
+    return path[2:] if path.startswith("./") else path
+
+
 class ValidationError:
     """Represents a validation error or warning."""
 
@@ -25,10 +58,11 @@ class ValidationError:
         self.level = level  # 'error' or 'warning'
         self.path = path
         self.message = message
+        icon = _ICONS.get(level, _ICONS["warning"])
+        self._display = f"{icon} {level.upper()}: {path}: {message}"
 
     def __str__(self):
-        icon = "❌" if self.level == "error" else "⚠️"
-        return f"{icon} {self.level.upper()}: {self.path}: {self.message}"
+        return self._display
 
 
 class MarketplaceValidator:
@@ -37,6 +71,8 @@ class MarketplaceValidator:
     def __init__(self, marketplace_path: Path):
         self.marketplace_path = marketplace_path
         self.base_dir = marketplace_path.parent.parent
+        self._base = os.fspath(self.base_dir)
+        self._exists_cache: Dict[str, bool] = {}
         self.errors: List[ValidationError] = []
         self.warnings: List[ValidationError] = []
         self.data: Dict[str, Any] = {}
@@ -59,15 +95,16 @@ class MarketplaceValidator:
     def _load_json(self) -> bool:
         """Load and parse the JSON file."""
         try:
-            with open(self.marketplace_path, "r") as f:
-                self.data = json.load(f)
+            with open(self.marketplace_path, "rb") as f:
+                self.data = _json_loads(f.read())
             return True
         except FileNotFoundError:
             self.errors.append(
                 ValidationError("error", str(self.marketplace_path), "File not found")
             )
             return False
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # JSONDecodeError (stdlib and orjson) and UnicodeDecodeError
             self.errors.append(
                 ValidationError(
                     "error",
@@ -144,7 +181,7 @@ class MarketplaceValidator:
                 self.errors.append(
                     ValidationError(
                         "error",
-                        f"{path_prefix}",
+                        path_prefix,
                         "Missing required field 'name'"
                     )
                 )
@@ -176,7 +213,7 @@ class MarketplaceValidator:
                 self.errors.append(
                     ValidationError(
                         "error",
-                        f"{path_prefix}",
+                        path_prefix,
                         "Missing required field 'source'"
                     )
                 )
@@ -203,12 +240,13 @@ class MarketplaceValidator:
                 )
 
             # Validate component arrays
-            for component_type in ["agents", "commands", "skills"]:
+            plugin_source = plugin.get("source", "")
+            for component_type in _COMPONENT_TYPES:
                 if component_type in plugin:
                     self._validate_component_array(
                         plugin[component_type],
                         f"{path_prefix}.{component_type}",
-                        plugin.get("source", "")
+                        plugin_source
                     )
 
     def _validate_source_path(self, source: str, path_prefix: str):
@@ -233,9 +271,20 @@ class MarketplaceValidator:
                 )
             )
 
-        # Check if directory exists
-        source_path = self.base_dir / source.lstrip("./")
-        if not source_path.exists():
+        # Check if directory exists, reusing one stat() for both checks
+        source_path = os.path.join(self._base, _strip_dot_slash(source))
+        try:
+            source_stat = os.stat(source_path)
+        except OSError as e:
+            # Other errors (e.g. permission denied) still propagate
+            if e.errno not in _MISSING_ERRNOS:
+                raise
+            source_stat = None
+        except ValueError:
+            # Embedded NUL byte; no such path can exist
+            source_stat = None
+
+        if source_stat is None:
             self.errors.append(
                 ValidationError(
                     "error",
@@ -243,7 +292,9 @@ class MarketplaceValidator:
                     f"Source directory '{source}' does not exist"
                 )
             )
-        elif not source_path.is_dir():
+            return
+
+        if not stat.S_ISDIR(source_stat.st_mode):
             self.errors.append(
                 ValidationError(
                     "error",
@@ -269,8 +320,6 @@ class MarketplaceValidator:
             )
             return
 
-        component_type = path_prefix.split(".")[-1]  # Extract 'agents', 'commands', etc.
-
         for idx, component in enumerate(components):
             comp_path = f"{path_prefix}[{idx}]"
 
@@ -306,8 +355,8 @@ class MarketplaceValidator:
                 else:
                     # Resolve full path
                     if plugin_source:
-                        full_path = self.base_dir / plugin_source.lstrip("./") / comp_file_path
-                        if not full_path.exists():
+                        full_path = os.path.join(self._base, _strip_dot_slash(plugin_source), comp_file_path)
+                        if not self._path_exists(full_path):
                             self.errors.append(
                                 ValidationError(
                                     "error",
@@ -316,39 +365,42 @@ class MarketplaceValidator:
                                 )
                             )
 
+    def _path_exists(self, path: str) -> bool:
+        """Check path existence, memoized for the duration of the run."""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            self._exists_cache[path] = exists
+        return exists
+
     @staticmethod
     def _is_valid_kebab_case(name: str) -> bool:
         """Check if string follows kebab-case convention."""
-        if not name:
-            return False
-        if not all(c.islower() or c.isdigit() or c == '-' for c in name):
-            return False
-        if name.startswith('-') or name.endswith('-'):
-            return False
-        if '--' in name:
-            return False
-        return True
+        return bool(_KEBAB_RE.fullmatch(name))
 
     def print_report(self):
         """Print validation report."""
+        # Assemble the whole report and emit it with a single write
+        parts: List[str] = []
+
         if self.errors:
-            print("\n🔴 ERRORS:")
-            for error in self.errors:
-                print(f"  {error}")
+            parts.append("\n🔴 ERRORS:")
+            parts.extend(f"  {error}" for error in self.errors)
 
         if self.warnings:
-            print("\n⚠️  WARNINGS:")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            parts.append("\n⚠️  WARNINGS:")
+            parts.extend(f"  {warning}" for warning in self.warnings)
 
-        print("\n" + "=" * 60)
+        parts.append("\n" + "=" * 60)
         if self.errors:
-            print(f"❌ Validation FAILED: {len(self.errors)} error(s), {len(self.warnings)} warning(s)")
+            parts.append(f"❌ Validation FAILED: {len(self.errors)} error(s), {len(self.warnings)} warning(s)")
         elif self.warnings:
-            print(f"✅ Validation PASSED with {len(self.warnings)} warning(s)")
+            parts.append(f"✅ Validation PASSED with {len(self.warnings)} warning(s)")
         else:
-            print("✅ Validation PASSED: No errors or warnings")
-        print("=" * 60)
+            parts.append("✅ Validation PASSED: No errors or warnings")
+        parts.append("=" * 60)
+
+        sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main():
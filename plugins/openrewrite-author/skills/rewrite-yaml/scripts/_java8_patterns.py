@@ -0,0 +1,78 @@
+"""
+Java 9+ language feature patterns shared by the Java 8 compatibility checks.
+
+Imported by the validator scripts that sit next to this module.
+
+Regression cases (run ``python -m doctest _java8_patterns.py`` to check).
+Each rule is searched for separately, so a rule is reported even when its
+match overlaps another rule's:
+
+>>> def rules(text):
+...     return [name for name, pattern, _ in PATTERNS if pattern.search(text)]
+>>> rules('int r = switch (k) { case A -> var x = foo(); case B -> 2; };')
+['var_keyword', 'switch_expression']
+>>> rules('if (o instanceof String s && (var t = 1) > 0) {')
+['var_keyword', 'pattern_matching_instanceof']
+>>> rules('switch (k) { case A -> String s = \"\"\" ; case B -> 1;')
+['switch_expression', 'text_block']
+
+Common multi-line and non-assignment forms are detected:
+
+>>> rules('for (var e : list) { }')
+['var_keyword']
+>>> rules('return switch (k) {\\n    case A -> "a";\\n    default -> "b";\\n};')
+['switch_expression']
+>>> rules('if (o instanceof String s\\n        && s.isEmpty()) {')
+['pattern_matching_instanceof']
+>>> rules('record Pair<A, B>(A a, B b) {}')
+['record_declaration']
+
+Java 8 code that merely mentions the keywords is not flagged:
+
+>>> rules('int var = 1; // var is a legal name in Java 8\\nswitch (k) { case A: break; }')
+[]
+>>> rules('switch (k) { case 1: list.forEach(s -> f(s)); break; }')
+[]
+"""
+
+import re
+
+# Patterns for Java 9+ features as (name, compiled pattern, message).
+# They are matched against the whole file and a violation is reported on the
+# line where its match starts. Whitespace ([^\S\n]) and negated classes
+# exclude '\n' to keep matches on one line, except for switch expressions,
+# whose first case label usually sits on the line below the switch. Only an
+# arrow right after that first label counts, so a lambda inside a classic
+# 'case 1:' block is not mistaken for a switch expression.
+PATTERNS = (
+    (
+        'var_keyword',
+        re.compile(r'\bvar[^\S\n]+\w+[^\S\n]*[=:,)]'),
+        'Java 10+ feature: local variable type inference (var)'
+    ),
+    (
+        'switch_expression',
+        re.compile(r'\bswitch\s*\([^)]+\)\s*\{\s*(?:case\b[^:;{}]*|default\s*)->'),
+        'Java 14+ feature: switch expressions with arrows'
+    ),
+    (
+        'text_block',
+        re.compile(r'"""'),
+        'Java 15+ feature: text blocks (triple quotes)'
+    ),
+    (
+        'pattern_matching_instanceof',
+        re.compile(r'\binstanceof[^\S\n]+\w+[^\S\n]+\w+'),
+        'Java 16+ feature: pattern matching for instanceof'
+    ),
+    (
+        'record_declaration',
+        re.compile(r'\brecord[^\S\n]+\w+[^\S\n]*[(<]'),
+        'Java 16+ feature: record types'
+    ),
+    (
+        'sealed_class',
+        re.compile(r'\bsealed[^\S\n]+(?:class|interface)'),
+        'Java 17+ feature: sealed classes'
+    ),
+)
@@ -15,73 +15,82 @@ Exit codes:
     2 - Error occurred
 """
 
+import os
 import re
 import sys
+from bisect import bisect_left
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from _java8_patterns import PATTERNS
+
+# (file path, line number, message, offending line)
+Violation = Tuple[str, int, str, str]
+
+_NEWLINE_RE = re.compile('\n')
+
+# Lines starting with these (after indentation) are comments
+_COMMENT_PREFIXES = ('//', '/*')
+
+# Below this many files, worker start-up costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+
+def _iter_java_files(root: str) -> Iterator[str]:
+    """Yield paths of all .java files under root, skipping symlinked directories."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+
+    subdirs = []
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.java') and entry.is_file():
+                yield entry.path
+
+    for subdir in subdirs:
+        yield from _iter_java_files(subdir)
+
+
+def _map_files(func: Callable, paths: List[Path]) -> Iterable:
+    """Apply func to every path, fanning out to worker processes for large batches."""
+    workers = os.cpu_count() or 1
+    if len(paths) < _PARALLEL_MIN_FILES or workers < 2:
+        return map(func, paths)
+
+    # Imported here: concurrent.futures is slow to import and most runs stay serial
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, paths, chunksize=max(1, len(paths) // (workers * 4))))
+    except (OSError, NotImplementedError):
+        # Process pools are unavailable on some restricted platforms
+        return map(func, paths)
 
 
 class Java8Validator:
     """Validates Java source files for Java 8 compatibility."""
 
-    # Patterns for Java 9+ features
-    PATTERNS = {
-        'var_keyword': (
-            r'\bvar\s+\w+\s*=',
-            'Java 10+ feature: local variable type inference (var)'
-        ),
-        'switch_expression': (
-            r'\bswitch\s*\([^)]+\)\s*\{[^}]*->',
-            'Java 14+ feature: switch expressions with arrows'
-        ),
-        'text_block': (
-            r'"""',
-            'Java 15+ feature: text blocks (triple quotes)'
-        ),
-        'pattern_matching_instanceof': (
-            r'\binstanceof\s+\w+\s+\w+\s*[^;{]*(?:\{|;)',
-            'Java 16+ feature: pattern matching for instanceof'
-        ),
-        'record_declaration': (
-            r'\brecord\s+\w+\s*\(',
-            'Java 16+ feature: record types'
-        ),
-        'sealed_class': (
-            r'\bsealed\s+(?:class|interface)',
-            'Java 17+ feature: sealed classes'
-        ),
-    }
+    # Java 9+ feature rules, shared with the other validators
+    PATTERNS = PATTERNS
 
     def __init__(self):
-        self.violations: List[Tuple[str, int, str, str]] = []
+        self.violations: List[Violation] = []
 
     def validate_file(self, file_path: Path) -> None:
         """Validate a single Java file for Java 8 compatibility."""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            lines = content.splitlines()
-
-            for pattern_name, (pattern, message) in self.PATTERNS.items():
-                for line_num, line in enumerate(lines, start=1):
-                    # Skip comments
-                    if line.strip().startswith('//') or line.strip().startswith('/*'):
-                        continue
-
-                    if re.search(pattern, line):
-                        self.violations.append((
-                            str(file_path),
-                            line_num,
-                            message,
-                            line.strip()
-                        ))
-
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}", file=sys.stderr)
+        self.violations.extend(find_violations(file_path))
 
     def validate_directory(self, dir_path: Path) -> None:
         """Recursively validate all Java files in a directory."""
-        for java_file in dir_path.rglob('*.java'):
-            self.validate_file(java_file)
+        java_files = [Path(path) for path in _iter_java_files(os.fspath(dir_path))]
+        for violations in _map_files(find_violations, java_files):
+            self.violations.extend(violations)
 
     def report(self) -> int:
         """Print validation report and return exit code."""
@@ -89,25 +98,72 @@ class Java8Validator:
             print("✓ No Java 8 compatibility violations found")
             return 0
 
-        print(f"✗ Found {len(self.violations)} Java 8 compatibility violation(s):\n")
+        # Assemble the whole report and emit it with a single write
+        parts = [f"✗ Found {len(self.violations)} Java 8 compatibility violation(s):\n"]
 
         for file_path, line_num, message, line in self.violations:
-            print(f"{file_path}:{line_num}")
-            print(f"  Issue: {message}")
-            print(f"  Code:  {line}")
-            print()
-
-        print("\nRecommendations:")
-        print("- Use explicit types instead of 'var'")
-        print("- Use traditional switch statements instead of switch expressions")
-        print("- Use String concatenation instead of text blocks")
-        print("- Use explicit casting after instanceof checks")
-        print("- Use regular classes instead of records")
-        print("- Use regular classes/interfaces instead of sealed types")
+            parts.append(f"{file_path}:{line_num}\n  Issue: {message}\n  Code:  {line}\n")
+
+        parts.append("\nRecommendations:")
+        parts.append("- Use explicit types instead of 'var'")
+        parts.append("- Use traditional switch statements instead of switch expressions")
+        parts.append("- Use String concatenation instead of text blocks")
+        parts.append("- Use explicit casting after instanceof checks")
+        parts.append("- Use regular classes instead of records")
+        parts.append("- Use regular classes/interfaces instead of sealed types")
+
+        sys.stdout.write("\n".join(parts) + "\n")
 
         return 1
 
 
+def find_violations(file_path: Path) -> List[Violation]:
+    """Return the Java 8 compatibility violations in a single Java file."""
+    violations: List[Violation] = []
+
+    try:
+        content = file_path.read_bytes().decode('utf-8', 'replace')
+
+        # Offsets of every newline, built lazily once the file has a hit
+        newlines = None
+        reported = set()
+
+        for rule, (pattern_name, pattern, message) in enumerate(Java8Validator.PATTERNS):
+            for match in pattern.finditer(content):
+                if newlines is None:
+                    newlines = [nl.start() for nl in _NEWLINE_RE.finditer(content)]
+
+                line_index = bisect_left(newlines, match.start())
+                if (line_index, rule) in reported:
+                    continue
+
+                line_start = newlines[line_index - 1] + 1 if line_index else 0
+                line_end = newlines[line_index] if line_index < len(newlines) else len(content)
+                line = content[line_start:line_end].strip()
+
+                # Skip comments
+                if line.startswith(_COMMENT_PREFIXES):
+                    continue
+
+                # Report each rule at most once per line
+                reported.add((line_index, rule))
+                violations.append((
+                    str(file_path),
+                    line_index + 1,
+                    message,
+                    line
+                ))
+
+        # Rules are scanned one after another; list hits in line order.
+        # The sort is stable, so rules on the same line keep their order.
+        violations.sort(key=itemgetter(1))
+
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}", file=sys.stderr)
+
+    return violations
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) != 2:
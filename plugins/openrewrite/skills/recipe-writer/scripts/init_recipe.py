@@ -13,39 +13,15 @@ Usage:
 
 import argparse
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+# Zero-width position before each uppercase letter except the first
+_CAMEL_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
 
-def read_license_header():
-    """Read license header from gradle/licenseHeader.txt if it exists."""
-    license_path = Path.cwd()
-    while license_path != license_path.parent:
-        license_file = license_path / "gradle" / "licenseHeader.txt"
-        if license_file.exists():
-            with open(license_file, 'r') as f:
-                content = f.read()
-                # Substitute ${year} with current year
-                content = content.replace("${year}", str(datetime.now().year))
-                return content + "\n"
-        license_path = license_path.parent
-    return ""
-
-
-def to_snake_case(name):
-    """Convert PascalCase to snake_case."""
-    result = []
-    for i, char in enumerate(name):
-        if char.isupper() and i > 0:
-            result.append('_')
-        result.append(char.lower())
-    return ''.join(result)
-
-
-def generate_recipe_class(name, package, description, license_header):
-    """Generate the recipe class file content."""
-    return f"""{license_header}package {package};
+_RECIPE_TMPL = """{license_header}package {package};
 
 import org.openrewrite.*;
 import org.openrewrite.yaml.YamlIsoVisitor;
@@ -76,10 +52,7 @@ public class {name} extends Recipe {{
 }}
 """
 
-
-def generate_parameterized_recipe_class(name, package, description, license_header):
-    """Generate a parameterized recipe class file content."""
-    return f"""{license_header}package {package};
+_PARAM_RECIPE_TMPL = """{license_header}package {package};
 
 import lombok.EqualsAndHashCode;
 import lombok.Value;
@@ -121,10 +94,7 @@ public class {name} extends Recipe {{
 }}
 """
 
-
-def generate_test_class(name, package, license_header):
-    """Generate the test class file content."""
-    return f"""{license_header}package {package};
+_TEST_TMPL = """{license_header}package {package};
 
 import org.junit.jupiter.api.Test;
 import org.openrewrite.test.RecipeSpec;
@@ -182,10 +152,7 @@ class {name}Test implements RewriteTest {{
 }}
 """
 
-
-def generate_declarative_recipe(name, package, description):
-    """Generate declarative YAML recipe content."""
-    return f"""---
+_DECL_TMPL = """---
 type: specs.openrewrite.org/v1beta/recipe
 name: {package}.{name}
 displayName: {name}
@@ -199,11 +166,73 @@ recipeList:
 """
 
 
+def read_license_header(year):
+    """Read license header from gradle/licenseHeader.txt if it exists."""
+    search_dir = os.getcwd()
+    while True:
+        license_file = os.path.join(search_dir, "gradle", "licenseHeader.txt")
+        try:
+            with open(license_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            parent = os.path.dirname(search_dir)
+            if parent == search_dir:
+                return ""
+            search_dir = parent
+            continue
+        # Substitute ${year} with the given year
+        content = content.replace("${year}", str(year))
+        return content + "\n"
+
+
+def to_snake_case(name):
+    """Convert PascalCase to snake_case."""
+    return _CAMEL_BOUNDARY.sub('_', name).lower()
+
+
+def generate_recipe_class(name, package, description, license_header):
+    """Generate the recipe class file content."""
+    return _RECIPE_TMPL.format_map({
+        "name": name,
+        "package": package,
+        "description": description,
+        "license_header": license_header
+    })
+
+
+def generate_parameterized_recipe_class(name, package, description, license_header):
+    """Generate a parameterized recipe class file content."""
+    return _PARAM_RECIPE_TMPL.format_map({
+        "name": name,
+        "package": package,
+        "description": description,
+        "license_header": license_header
+    })
+
+
+def generate_test_class(name, package, license_header):
+    """Generate the test class file content."""
+    return _TEST_TMPL.format_map({
+        "name": name,
+        "package": package,
+        "license_header": license_header
+    })
+
+
+def generate_declarative_recipe(name, package, description):
+    """Generate declarative YAML recipe content."""
+    return _DECL_TMPL.format_map({
+        "name": name,
+        "package": package,
+        "description": description
+    })
+
+
 def create_file(path, content):
     """Create a file with the given content."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w') as f:
-        f.write(content)
+    with open(path, 'wb') as f:
+        f.write(content.encode('utf-8'))
     print(f"Created: {path}")
 
 
@@ -250,9 +279,10 @@ def main():
         sys.exit(1)
 
     # Read license header
-    license_header = read_license_header()
+    year = datetime.now().year
+    license_header = read_license_header(year)
     if license_header:
-        print(f"Found license header (will use year {datetime.now().year})")
+        print(f"Found license header (will use year {year})")
 
     # Convert package to path
     package_path = args.package.replace('.', '/')
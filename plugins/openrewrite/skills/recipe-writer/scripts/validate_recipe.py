@@ -13,15 +13,48 @@ Usage:
     python validate_recipe.py <path-to-recipe>
     python validate_recipe.py <path-to-recipe> --java-version 8
     python validate_recipe.py <path-to-recipe> --no-compile
+    python validate_recipe.py <path-to-recipe> <path-to-recipe> ...
 """
 
-import argparse
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+from _java8_patterns import PATTERNS
+
+# Java recipe structure. _RE_RECIPE_STRUCTURE finds every structural marker
+# in one pass; match.lastgroup names the marker. The display-name literal
+# must precede the bare getDisplayName() alternative to win at that position.
+_RE_RECIPE_CLASS = re.compile(r'class\s+(\w+)\s+extends\s+Recipe')
+_RE_RECIPE_STRUCTURE = re.compile(
+    r'(?P<recipe_class>class\s+\w+\s+extends\s+Recipe)'
+    r'|(?P<value>@Value)'
+    r'|(?P<equals_and_hash_code>@EqualsAndHashCode)'
+    r'|(?P<display_name_literal>getDisplayName\(\)\s*{\s*return\s*"(?P<display_name>[^"]+)")'
+    r'|(?P<get_display_name>getDisplayName\(\))'
+    r'|(?P<get_description>getDescription\(\))'
+    r'|(?P<get_visitor>getVisitor\(\))'
+    r'|(?P<option>@Option\([^)]+\))'
+)
+_RE_VISITOR_BODY = re.compile(r'public\s+TreeVisitor<\?.*?>\s+getVisitor\([^)]*\)\s*{([^}]+)}', re.DOTALL)
+
+# Naming conventions
+_RE_PACKAGE = re.compile(r'package\s+([\w.]+);')
+_RE_VERB_NOUN = re.compile(r'^[A-Z][a-z]+[A-Z]')
+
+# Declarative YAML recipes
+_RE_YAML_NAME = re.compile(r'^name:\s+([\w.]+)', re.MULTILINE)
+_RE_YAML_DISPLAY_NAME = re.compile(r'^displayName:', re.MULTILINE)
+_RE_YAML_DESCRIPTION = re.compile(r'^description:', re.MULTILINE)
+_RE_YAML_RECIPE_LIST = re.compile(r'^recipeList:', re.MULTILINE)
+_RE_QUALIFIED_NAME = re.compile(r'^[\w.]+\.[\w.]+$')
+
+# javac diagnostics start with "<path>:<line>: " and are followed by source
+# and caret lines; the trailing "N errors" summary belongs to no file
+_RE_JAVAC_DIAGNOSTIC = re.compile(r'^(.+?):\d+: ')
+_RE_JAVAC_SUMMARY = re.compile(r'^\d+ (?:error|warning)s?$')
 
 
 class Colors:
@@ -54,51 +87,59 @@ def check_java_file_structure(content: str, file_path: Path) -> List[str]:
     """Validate Java recipe file structure"""
     errors = []
 
+    # Collect all structural markers in a single scan
+    found = set()
+    display_name = None
+    options = []
+    for match in _RE_RECIPE_STRUCTURE.finditer(content):
+        marker = match.lastgroup
+        found.add(marker)
+        if marker == 'display_name_literal':
+            found.add('get_display_name')
+            if display_name is None:
+                display_name = match.group('display_name')
+        elif marker == 'option':
+            options.append(match.group(0))
+
     # Check for Recipe class
-    if not re.search(r'class\s+\w+\s+extends\s+Recipe', content):
+    if 'recipe_class' not in found:
         errors.append("Recipe class must extend Recipe")
 
     # Check for @Value annotation (for immutability)
-    if '@Value' not in content:
+    if 'value' not in found:
         print_warning(f"Consider using @Value annotation for immutability")
 
     # Check for @EqualsAndHashCode
-    if '@EqualsAndHashCode' not in content:
+    if 'equals_and_hash_code' not in found:
         print_warning("Consider using @EqualsAndHashCode(callSuper = false)")
 
     # Check for required methods
-    if 'getDisplayName()' not in content:
+    if 'get_display_name' not in found:
         errors.append("Recipe must override getDisplayName()")
 
-    if 'getDescription()' not in content:
+    if 'get_description' not in found:
         errors.append("Recipe must override getDescription()")
 
-    if 'getVisitor()' not in content:
+    if 'get_visitor' not in found:
         errors.append("Recipe must override getVisitor()")
 
     # Check for proper return in getVisitor
-    if 'getVisitor()' in content:
-        visitor_match = re.search(r'public\s+TreeVisitor<\?.*?>\s+getVisitor\([^)]*\)\s*{([^}]+)}', content, re.DOTALL)
+    if 'get_visitor' in found:
+        visitor_match = _RE_VISITOR_BODY.search(content)
         if visitor_match:
             visitor_body = visitor_match.group(1)
             if 'new ' not in visitor_body:
                 print_warning("getVisitor() should return a NEW instance (no caching)")
 
     # Check display name ends with period
-    display_name_match = re.search(r'getDisplayName\(\)\s*{\s*return\s*"([^"]+)"', content)
-    if display_name_match:
-        display_name = display_name_match.group(1)
+    if display_name is not None:
         if not display_name.endswith('.') and not display_name.endswith('!') and not display_name.endswith('?'):
             print_warning(f"Display name should end with a period: '{display_name}'")
 
-    # Check for @Option annotations on parameters
-    option_count = content.count('@Option')
-    if option_count > 0:
-        # Check that options have example
-        for match in re.finditer(r'@Option\([^)]+\)', content):
-            option = match.group(0)
-            if 'example' not in option:
-                print_warning("@Option should include an example parameter")
+    # Check that @Option annotations on parameters have an example
+    for option in options:
+        if 'example' not in option:
+            print_warning("@Option should include an example parameter")
 
     return errors
 
@@ -108,19 +149,19 @@ def check_naming_conventions(content: str, file_path: Path) -> List[str]:
     errors = []
 
     # Extract package name
-    package_match = re.search(r'package\s+([\w.]+);', content)
+    package_match = _RE_PACKAGE.search(content)
     if package_match:
         package = package_match.group(1)
-        if package.startswith('com.yourorg') or package.startswith('com.example'):
+        if package.startswith(('com.yourorg', 'com.example')):
             print_warning(f"Update placeholder package name: {package}")
 
     # Extract class name
-    class_match = re.search(r'class\s+(\w+)\s+extends\s+Recipe', content)
+    class_match = _RE_RECIPE_CLASS.search(content)
     if class_match:
         class_name = class_match.group(1)
 
         # Check naming convention (VerbNoun pattern)
-        if not re.match(r'^[A-Z][a-z]+[A-Z]', class_name):
+        if not _RE_VERB_NOUN.match(class_name):
             print_warning(f"Recipe class name should follow VerbNoun pattern: {class_name}")
 
         # Check file name matches class name
@@ -133,43 +174,25 @@ def check_naming_conventions(content: str, file_path: Path) -> List[str]:
 
 def check_java8_compatibility_patterns(content: str) -> List[str]:
     """Check for Java 8 incompatible patterns"""
-    warnings = []
-
-    # Check for var keyword
-    if re.search(r'\bvar\b', content):
-        warnings.append("Found 'var' keyword - not available in Java 8")
-
-    # Check for text blocks
-    if '"""' in content:
-        warnings.append("Found text blocks (triple quotes) - not available in Java 8")
-
-    # Check for switch expressions
-    if re.search(r'switch\s*\([^)]+\)\s*{[^}]*->', content):
-        warnings.append("Found switch expression - not available in Java 8")
-
-    # Check for pattern matching
-    if re.search(r'instanceof\s+\w+\s+\w+\s+&&', content):
-        warnings.append("Found pattern matching in instanceof - not available in Java 8")
+    # Report each shared rule once, in rule order
+    return [message for _, pattern, message in PATTERNS if pattern.search(content)]
 
-    # Check for record keyword
-    if re.search(r'\brecord\s+\w+', content):
-        warnings.append("Found record - not available in Java 8")
 
-    return warnings
+def compile_many_with_javac(file_paths: List[Path], java_version: int = 8) -> Tuple[bool, str]:
+    """Try to compile all files with a single javac run, paying JVM startup once"""
+    # Imported here so runs that skip compilation don't pay for them
+    import subprocess
+    import tempfile
 
-
-def compile_with_javac(file_path: Path, java_version: int = 8) -> Tuple[bool, str]:
-    """Try to compile the file with javac"""
     try:
         # Create a temporary directory for compilation
-        import tempfile
         with tempfile.TemporaryDirectory() as tmpdir:
             result = subprocess.run(
                 ['javac', '-source', str(java_version), '-target', str(java_version),
-                 '-d', tmpdir, str(file_path)],
+                 '-d', tmpdir, *map(str, file_paths)],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=10 * len(file_paths)
             )
 
             if result.returncode == 0:
@@ -185,6 +208,28 @@ def compile_with_javac(file_path: Path, java_version: int = 8) -> Tuple[bool, st
         return False, str(e)
 
 
+def split_javac_output(output: str, file_paths: List[Path]) -> Dict[Path, str]:
+    """Attribute javac diagnostics to the file each one reports on"""
+    paths = {str(file_path): file_path for file_path in file_paths}
+    per_file: Dict[Path, List[str]] = {}
+    current = None
+
+    for line in output.splitlines():
+        if _RE_JAVAC_SUMMARY.match(line):
+            current = None
+            continue
+
+        diagnostic = _RE_JAVAC_DIAGNOSTIC.match(line)
+        if diagnostic and diagnostic.group(1) in paths:
+            current = paths[diagnostic.group(1)]
+
+        # Source and caret lines belong to the preceding diagnostic
+        if current is not None:
+            per_file.setdefault(current, []).append(line)
+
+    return {file_path: '\n'.join(lines) for file_path, lines in per_file.items()}
+
+
 def validate_yaml_recipe(content: str, file_path: Path) -> List[str]:
     """Validate YAML recipe format"""
     errors = []
@@ -193,23 +238,23 @@ def validate_yaml_recipe(content: str, file_path: Path) -> List[str]:
     if 'type: specs.openrewrite.org/v1beta/recipe' not in content:
         errors.append("YAML recipe must have 'type: specs.openrewrite.org/v1beta/recipe'")
 
-    if not re.search(r'^name:\s+[\w.]+', content, re.MULTILINE):
+    if not _RE_YAML_NAME.search(content):
         errors.append("YAML recipe must have 'name' field")
 
-    if not re.search(r'^displayName:', content, re.MULTILINE):
+    if not _RE_YAML_DISPLAY_NAME.search(content):
         errors.append("YAML recipe must have 'displayName' field")
 
-    if not re.search(r'^description:', content, re.MULTILINE):
+    if not _RE_YAML_DESCRIPTION.search(content):
         errors.append("YAML recipe must have 'description' field")
 
-    if not re.search(r'^recipeList:', content, re.MULTILINE):
+    if not _RE_YAML_RECIPE_LIST.search(content):
         errors.append("YAML recipe must have 'recipeList' field")
 
     # Check naming convention
-    name_match = re.search(r'^name:\s+([\w.]+)', content, re.MULTILINE)
+    name_match = _RE_YAML_NAME.search(content)
     if name_match:
         name = name_match.group(1)
-        if not re.match(r'^[\w.]+\.[\w.]+$', name):
+        if not _RE_QUALIFIED_NAME.match(name):
             print_warning(f"Recipe name should be fully qualified: {name}")
         if 'yourorg' in name.lower() or 'example' in name.lower():
             print_warning(f"Update placeholder recipe name: {name}")
@@ -251,7 +296,7 @@ def validate_recipe(file_path: Path, java_version: int = 8, skip_compile: bool =
         # Try to compile if not skipped
         if not skip_compile:
             print_info("Attempting compilation...")
-            success, compile_error = compile_with_javac(file_path, java_version)
+            success, compile_error = compile_many_with_javac([file_path], java_version)
             if not success:
                 if "javac not found" in compile_error:
                     print_warning("javac not found - skipping compilation check")
@@ -293,7 +338,42 @@ def validate_recipe(file_path: Path, java_version: int = 8, skip_compile: bool =
         return False
 
 
+def validate_recipes(file_paths: List[Path], java_version: int = 8, skip_compile: bool = False) -> bool:
+    """Validate several recipe files, compiling the Java sources together at the end"""
+    success = True
+    java_files = []
+
+    for file_path in file_paths:
+        if not validate_recipe(file_path, java_version, skip_compile=True):
+            success = False
+        if file_path.suffix == '.java' and file_path.is_file():
+            java_files.append(file_path)
+
+    if skip_compile or not java_files:
+        return success
+
+    print(f"{Colors.BOLD}Compiling {len(java_files)} Java file(s){Colors.RESET}\n")
+    compiled, compile_error = compile_many_with_javac(java_files, java_version)
+    if compiled:
+        print_success("Compilation successful\n")
+    elif "javac not found" in compile_error:
+        print_warning("javac not found - skipping compilation check\n")
+    else:
+        diagnostics = split_javac_output(compile_error, java_files)
+        if not diagnostics:
+            # Nothing could be attributed to a single file; show it all
+            print_error(f"Compilation failed:\n{compile_error}")
+        for file_path, diagnostic in diagnostics.items():
+            print_error(f"Compilation failed: {file_path}\n{diagnostic}")
+        print(f"\n{Colors.RED}{Colors.BOLD}✗ Validation failed{Colors.RESET}\n")
+        success = False
+
+    return success
+
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Validate OpenRewrite recipe files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -310,10 +390,13 @@ Examples:
 
   # Validate a YAML recipe
   python validate_recipe.py src/main/resources/META-INF/rewrite/my-recipe.yml
+
+  # Validate several recipes, compiling them with a single javac run
+  python validate_recipe.py src/main/java/com/example/*.java
         '''
     )
 
-    parser.add_argument('path', type=str, help='Path to recipe file')
+    parser.add_argument('paths', type=str, nargs='+', help='Path(s) to recipe files')
     parser.add_argument('--java-version', type=int, default=8,
                         help='Target Java version (default: 8)')
     parser.add_argument('--no-compile', action='store_true',
@@ -321,8 +404,11 @@ Examples:
 
     args = parser.parse_args()
 
-    file_path = Path(args.path)
-    success = validate_recipe(file_path, args.java_version, args.no_compile)
+    file_paths = [Path(path) for path in args.paths]
+    if len(file_paths) == 1:
+        success = validate_recipe(file_paths[0], args.java_version, args.no_compile)
+    else:
+        success = validate_recipes(file_paths, args.java_version, args.no_compile)
 
     sys.exit(0 if success else 1)
 
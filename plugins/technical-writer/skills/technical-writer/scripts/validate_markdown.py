@@ -13,10 +13,60 @@ Usage:
     python validate_markdown.py <directory_path>
 """
 
+import mmap
+import os
 import re
 import sys
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
+
+# Patterns run over the raw file bytes (an mmap), not decoded text
+
+# ATX-style headings (# Heading). Anchored per line so the engine can skip
+# lines that don't start with '#'; the title stops before a CRLF's '\r'.
+_HEADING_RE = re.compile(rb'(?m)^(#{1,6})[ \t]+([^\r\n]+)')
+
+# Code fence lines (```lang), possibly indented
+_FENCE_RE = re.compile(rb'^[ \t]*```([^\n]*)$', re.MULTILINE)
+
+_NEWLINE_RE = re.compile(rb'\n')
+
+# Inline markdown links [text](url); classes exclude '\n' so a match
+# found in the whole buffer never spans lines
+_LINK_RE = re.compile(rb'\[([^\]\n]+)\]\(([^)\n]+)\)')
+
+# Link text that says nothing about the destination
+_BAD_ANCHOR_TEXT = frozenset({'click here', 'here', 'read more', 'more'})
+_BAD_ANCHOR_MAX_LEN = max(map(len, _BAD_ANCHOR_TEXT))
+
+# Articles and short words that should be lowercase in sentence case
+_SMALL_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'but', 'or', 'for', 'nor', 'on', 'at', 'to', 'from', 'by', 'with'
+})
+
+# Below this many files, worker start-up costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+
+@lru_cache(maxsize=4096)
+def _is_title_case(text: str) -> bool:
+    """Check if text appears to be in title case (memoized; headings repeat across docs)."""
+    # Skip if starts with code or too short
+    if text.startswith('`'):
+        return False
+
+    words = text.split()
+    if len(words) < 3:
+        return False
+
+    tail = words[1:]
+    capitalized_count = sum(1 for word in tail if word[0].isupper() and word.lower() not in _SMALL_WORDS)
+
+    # If more than 50% of non-first words are capitalized, likely title case
+    return capitalized_count * 2 > len(tail)
 
 
 class ValidationError:
@@ -31,146 +81,144 @@ class ValidationError:
         return f"Line {self.line_num}: [{self.error_type}] {self.message}"
 
 
+# File contents as mapped by mmap, or b'' for an empty file
+Buffer = Union[mmap.mmap, bytes]
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a matched span of the file for use in a message."""
+    return raw.decode('utf-8', 'replace')
+
+
 class MarkdownValidator:
     """Validates markdown documentation files."""
 
     def __init__(self, file_path: Path):
         self.file_path = file_path
         self.errors: List[ValidationError] = []
-        self.lines: List[str] = []
+        self.newlines = array('Q')
         self.heading_levels: List[int] = []
+        self.h1_count = 0
 
     def validate(self) -> List[ValidationError]:
         """Run all validation checks and return list of errors."""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.lines = f.readlines()
-        except Exception as e:
+            with open(self.file_path, 'rb') as f:
+                # mmap cannot map a zero-length file
+                if os.fstat(f.fileno()).st_size == 0:
+                    self._run_checks(b'')
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self._run_checks(mm)
+        except OSError as e:
             return [ValidationError(0, "FILE_ERROR", f"Cannot read file: {e}")]
 
-        self._check_heading_hierarchy()
-        self._check_code_blocks()
-        self._check_links()
+        return sorted(self.errors, key=lambda e: e.line_num)
+
+    def _run_checks(self, buf: Buffer):
+        """Run every check over the file buffer."""
+        self.newlines = array('Q', (m.start() for m in _NEWLINE_RE.finditer(buf)))
+
+        self._check_heading_hierarchy(buf)
+        self._check_code_blocks(buf)
+        self._check_links(buf)
         self._check_basic_structure()
 
-        return sorted(self.errors, key=lambda e: e.line_num)
+    def _line_of(self, offset: int) -> int:
+        """Return the 1-based line number containing a byte offset."""
+        return bisect_left(self.newlines, offset) + 1
 
-    def _check_heading_hierarchy(self):
+    def _check_heading_hierarchy(self, buf: Buffer):
         """Check that heading levels don't skip (e.g., h1 -> h3)."""
         prev_level = 0
 
-        for i, line in enumerate(self.lines, 1):
-            # Match ATX-style headings (# Heading)
-            match = re.match(r'^(#{1,6})\s+(.+)', line)
-            if match:
-                level = len(match.group(1))
-                self.heading_levels.append(level)
-
-                # Check for skipped levels
-                if level > prev_level + 1:
-                    self.errors.append(ValidationError(
-                        i,
-                        "HEADING_SKIP",
-                        f"Heading level skipped (h{prev_level} -> h{level}). Use h{prev_level + 1} instead."
-                    ))
-
-                # Check for title case (common mistake)
-                title = match.group(2).strip()
-                if self._is_title_case(title) and level <= 3:
-                    self.errors.append(ValidationError(
-                        i,
-                        "TITLE_CASE",
-                        f"Heading appears to use title case. Use sentence case instead: '{title}'"
-                    ))
-
-                prev_level = level
-
-    def _is_title_case(self, text: str) -> bool:
-        """Check if text appears to be in title case."""
-        # Skip if too short or starts with code
-        if len(text.split()) < 3 or text.startswith('`'):
-            return False
-
-        words = text.split()
-        # Articles and short words that should be lowercase in sentence case
-        small_words = {'a', 'an', 'the', 'and', 'but', 'or', 'for', 'nor', 'on', 'at', 'to', 'from', 'by', 'with'}
-
-        capitalized_count = sum(1 for word in words[1:] if word and word[0].isupper() and word.lower() not in small_words)
-
-        # If more than 50% of non-first words are capitalized, likely title case
-        return capitalized_count > len(words[1:]) * 0.5
-
-    def _check_code_blocks(self):
+        # Find all ATX-style headings (# Heading) in one pass over the file
+        for match in _HEADING_RE.finditer(buf):
+            i = self._line_of(match.start())
+            level = match.end(1) - match.start(1)
+            self.heading_levels.append(level)
+            if level == 1:
+                self.h1_count += 1
+
+            # Check for skipped levels
+            if level > prev_level + 1:
+                self.errors.append(ValidationError(
+                    i,
+                    "HEADING_SKIP",
+                    f"Heading level skipped (h{prev_level} -> h{level}). Use h{prev_level + 1} instead."
+                ))
+
+            # Check for title case (common mistake)
+            title = _decode(match.group(2)).strip()
+            if _is_title_case(title) and level <= 3:
+                self.errors.append(ValidationError(
+                    i,
+                    "TITLE_CASE",
+                    f"Heading appears to use title case. Use sentence case instead: '{title}'"
+                ))
+
+            prev_level = level
+
+    def _check_code_blocks(self, buf: Buffer):
         """Check code block formatting."""
-        in_code_block = False
-        code_block_start = 0
-
-        for i, line in enumerate(self.lines, 1):
-            # Check for code block fences
-            if line.strip().startswith('```'):
-                if not in_code_block:
-                    # Starting a code block
-                    in_code_block = True
-                    code_block_start = i
-
-                    # Check for language tag
-                    fence_content = line.strip()[3:].strip()
-                    if not fence_content:
-                        self.errors.append(ValidationError(
-                            i,
-                            "CODE_BLOCK_LANG",
-                            "Code block missing language identifier (e.g., ```python, ```bash, ```markdown)"
-                        ))
-                else:
-                    # Ending a code block
-                    in_code_block = False
+        # Fences alternate: even-indexed ones open a block, odd-indexed ones close it
+        fences = list(_FENCE_RE.finditer(buf))
+
+        for fence in fences[::2]:
+            # Check for language tag
+            if not fence.group(1).strip():
+                self.errors.append(ValidationError(
+                    self._line_of(fence.start()),
+                    "CODE_BLOCK_LANG",
+                    "Code block missing language identifier (e.g., ```python, ```bash, ```markdown)"
+                ))
 
         # Check for unclosed code block
-        if in_code_block:
+        if len(fences) % 2:
             self.errors.append(ValidationError(
-                code_block_start,
+                self._line_of(fences[-1].start()),
                 "CODE_BLOCK_UNCLOSED",
                 "Code block opened but never closed"
             ))
 
-    def _check_links(self):
+    def _check_links(self, buf: Buffer):
         """Check link syntax."""
-        for i, line in enumerate(self.lines, 1):
-            # Find all markdown links [text](url)
-            links = re.finditer(r'\[([^\]]+)\]\(([^)]+)\)', line)
-
-            for match in links:
-                link_text = match.group(1)
-                link_url = match.group(2)
-
-                # Check for "click here" anti-pattern
-                if link_text.lower() in ['click here', 'here', 'read more', 'more']:
-                    self.errors.append(ValidationError(
-                        i,
-                        "LINK_TEXT",
-                        f"Non-descriptive link text: '{link_text}'. Use descriptive text that tells where the link goes."
-                    ))
-
-                # Check for empty link text
-                if not link_text.strip():
-                    self.errors.append(ValidationError(
-                        i,
-                        "LINK_EMPTY",
-                        "Link has empty text"
-                    ))
-
-                # Check for empty URL
-                if not link_url.strip():
-                    self.errors.append(ValidationError(
-                        i,
-                        "LINK_EMPTY_URL",
-                        f"Link '{link_text}' has empty URL"
-                    ))
+        # Find all markdown links [text](url) in one pass over the file
+        for match in _LINK_RE.finditer(buf):
+            i = self._line_of(match.start())
+            link_text = _decode(match.group(1))
+            link_url = _decode(match.group(2))
+
+            # Check for "click here" anti-pattern; longer text can't match
+            if len(link_text) <= _BAD_ANCHOR_MAX_LEN and link_text.lower() in _BAD_ANCHOR_TEXT:
+                self.errors.append(ValidationError(
+                    i,
+                    "LINK_TEXT",
+                    f"Non-descriptive link text: '{link_text}'. Use descriptive text that tells where the link goes."
+                ))
+
+            # Check for empty link text
+            if not link_text.strip():
+                self.errors.append(ValidationError(
+                    i,
+                    "LINK_EMPTY",
+                    "Link has empty text"
+                ))
+
+            # Check for empty URL
+            if not link_url.strip():
+                self.errors.append(ValidationError(
+                    i,
+                    "LINK_EMPTY_URL",
+                    f"Link '{link_text}' has empty URL"
+                ))
 
     def _check_basic_structure(self):
-        """Check basic document structure."""
+        """Check basic document structure (uses the H1 count from the heading pass)."""
+        h1_count = self.h1_count
+
         # Check for at least one H1
-        if not any(line.startswith('# ') for line in self.lines):
+        if h1_count == 0:
             self.errors.append(ValidationError(
                 1,
                 "NO_H1",
@@ -178,8 +226,7 @@ class MarkdownValidator:
             ))
 
         # Check for multiple H1s (often unintended)
-        h1_count = sum(1 for line in self.lines if line.startswith('# '))
-        if h1_count > 1:
+        elif h1_count > 1:
             self.errors.append(ValidationError(
                 1,
                 "MULTIPLE_H1",
@@ -196,14 +243,44 @@ def validate_file(file_path: Path) -> Tuple[Path, List[ValidationError]]:
 
 def validate_directory(dir_path: Path) -> List[Tuple[Path, List[ValidationError]]]:
     """Validate all markdown files in a directory."""
-    results = []
+    md_files = [Path(path) for path in _iter_markdown_files(os.fspath(dir_path))]
+    return [(file_path, errors) for file_path, errors in _map_files(validate_file, md_files) if errors]
 
-    for md_file in dir_path.rglob('*.md'):
-        file_path, errors = validate_file(md_file)
-        if errors:
-            results.append((file_path, errors))
 
-    return results
+def _iter_markdown_files(root: str) -> Iterator[str]:
+    """Yield paths of all .md files under root, skipping symlinked directories."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+
+    subdirs = []
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.md') and entry.is_file():
+                yield entry.path
+
+    for subdir in subdirs:
+        yield from _iter_markdown_files(subdir)
+
+
+def _map_files(func: Callable, paths: List[Path]) -> Iterable:
+    """Apply func to every path, fanning out to worker processes for large batches."""
+    workers = os.cpu_count() or 1
+    if len(paths) < _PARALLEL_MIN_FILES or workers < 2:
+        return map(func, paths)
+
+    # Imported here: concurrent.futures is slow to import and most runs stay serial
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, paths, chunksize=max(1, len(paths) // (workers * 4))))
+    except (OSError, NotImplementedError):
+        # Process pools are unavailable on some restricted platforms
+        return map(func, paths)
 
 
 def print_results(results: List[Tuple[Path, List[ValidationError]]]):
@@ -214,19 +291,23 @@ def print_results(results: List[Tuple[Path, List[ValidationError]]]):
 
     total_errors = sum(len(errors) for _, errors in results)
 
-    print(f"\n{'='*70}")
-    print(f"Found {total_errors} validation error(s) in {len(results)} file(s)")
-    print(f"{'='*70}\n")
+    # Assemble the whole report and emit it with a single write
+    parts = [
+        f"\n{'='*70}",
+        f"Found {total_errors} validation error(s) in {len(results)} file(s)",
+        f"{'='*70}\n",
+    ]
 
     for file_path, errors in results:
-        print(f"\n{file_path}:")
-        print("-" * 70)
-        for error in errors:
-            print(f"  {error}")
-
-    print(f"\n{'='*70}")
-    print(f"Total: {total_errors} error(s)")
-    print(f"{'='*70}\n")
+        parts.append(f"\n{file_path}:")
+        parts.append("-" * 70)
+        parts.extend(f"  {error}" for error in errors)
+
+    parts.append(f"\n{'='*70}")
+    parts.append(f"Total: {total_errors} error(s)")
+    parts.append(f"{'='*70}\n")
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main():